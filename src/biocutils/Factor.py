@@ -1,4 +1,5 @@
 from copy import copy, deepcopy
+from sys import intern
 from typing import Optional, Sequence, Union
 
 import numpy
@@ -22,29 +23,33 @@ from .subset_sequence import subset_sequence
 
 
 def _sanitize_codes(codes: Sequence[int], num_levels: int) -> numpy.ndarray:
+    target = numpy.min_scalar_type(-max(1, num_levels))  # get a signed type.
+
     if not isinstance(codes, numpy.ndarray):
-        replacement = numpy.ndarray(
-            len(codes), dtype=numpy.min_scalar_type(-num_levels)
-        )  # get a signed type.
-        for i, x in enumerate(codes):
-            if is_missing_scalar(x) or x < 0:
-                replacement[i] = -1
-            else:
-                replacement[i] = x
-        codes = replacement
-    else:
-        if len(codes.shape) != 1:
-            raise ValueError("'codes' should be a 1-dimensional array")
-        if not numpy.issubdtype(
-            codes.dtype, numpy.signedinteger
-        ):  # force it to be signed.
-            codes = codes.astype(numpy.min_scalar_type(-num_levels))
-
-    for x in codes:
-        if x < -1 or x >= num_levels:
-            raise ValueError(
-                "all entries of 'codes' should refer to an entry of 'levels'"
-            )
+        codes = numpy.fromiter(
+            (-1 if is_missing_scalar(x) or x < 0 else x for x in codes),
+            dtype=target,
+            count=len(codes),
+        )
+    elif len(codes.shape) != 1:
+        raise ValueError("'codes' should be a 1-dimensional array")
+
+    # Validating before any dtype conversion, so that narrowing cannot wrap
+    # out-of-range codes into the valid range.
+    if len(codes) and ((codes < -1) | (codes >= num_levels)).any():
+        raise ValueError(
+            "all entries of 'codes' should refer to an entry of 'levels'"
+        )
+
+    if (
+        not numpy.issubdtype(codes.dtype, numpy.signedinteger)
+        or codes.dtype.itemsize > target.itemsize
+    ):
+        # Force a signed type and eagerly narrow oversized codes; the remap
+        # kernels are memory-bound, so fewer bytes per code directly pays off.
+        codes = numpy.ascontiguousarray(codes, dtype=target)
+    elif not codes.flags.c_contiguous:
+        codes = numpy.ascontiguousarray(codes)
 
     return codes
 
@@ -60,6 +65,9 @@ def _sanitize_levels(levels: Sequence[str], check: bool = True) -> StringList:
             raise TypeError("all entries of 'levels' should be non-missing")
         if len(set(levels)) < len(levels):
             raise ValueError("all entries of 'levels' should be unique")
+        # Interned levels hash and compare by pointer, which speeds up the
+        # dict lookups in match() and the level comparisons in set_slice().
+        levels = StringList([intern(x) for x in levels], _validate=False)
 
     return levels
 
@@ -410,6 +418,10 @@ class Factor:
 
         If ``index`` is a sequence, this is an alias for :py:meth:`~get_slice`.
         """
+        if isinstance(index, (int, numpy.integer)) and not isinstance(index, bool):
+            # Fast path that avoids the subscript normalization overhead;
+            # negative and out-of-range indices are handled by NumPy itself.
+            return self.get_value(index)
         index, scalar = normalize_subscript(index, len(self), self._names)
         if scalar:
             return self.get_value(index[0])
@@ -494,17 +506,25 @@ class Factor:
         new_codes = output._codes
 
         index, scalar = normalize_subscript(index, len(self), self._names)
-        if self._levels == value._levels:
-            for i, x in enumerate(index):
-                new_codes[x] = value._codes[i]
+        index = numpy.asarray(index, dtype=numpy.intp)
+        vcodes = value._codes
+        if len(vcodes) != len(index):
+            # The vectorized assignments below would otherwise broadcast (or
+            # ignore) a mismatched replacement length instead of failing.
+            raise IndexError(
+                "length of 'value' must be equal to the number of indices ("
+                + str(len(index)) + ")"
+            )
+        if self._levels is value._levels or self._levels == value._levels:
+            new_codes[index] = vcodes
         else:
             mapping = match(value._levels, self._levels)
-            for i, x in enumerate(index):
-                v = value._codes[i]
-                if v >= 0:
-                    new_codes[x] = mapping[v]
-                else:
-                    new_codes[x] = -1
+            if len(mapping) == 0:
+                new_codes[index] = -1
+            else:
+                keep = vcodes >= 0
+                safe = numpy.where(keep, vcodes, 0)
+                new_codes[index] = numpy.where(keep, mapping[safe], -1)
 
         return output
 
@@ -537,30 +557,19 @@ class Factor:
             If ``in_place = True``, unused levels are removed from the
             current object; a reference to the current object is returned.
         """
-        if in_place:
-            output = self
-        else:
-            output = copy(self)
-            output._codes = copy(self._codes)
-
-        in_use = [False] * len(self._levels)
-        for x in self._codes:
-            if x >= 0:
-                in_use[x] = True
-
-        new_levels = StringList([])
-        reindex = [-1] * len(in_use)
-        for i, x in enumerate(in_use):
-            if x:
-                reindex[i] = len(new_levels)
-                new_levels.append(self._levels[i])
+        output = self._define_output(in_place)
 
-        new_codes = output._codes
-        for i, x in enumerate(self._codes):
-            if x >= 0:
-                new_codes[i] = reindex[x]
+        nonmissing = self._codes >= 0  # one SIMD compare, reused below.
+        in_use = numpy.zeros(len(self._levels), dtype=bool)
+        in_use[self._codes[nonmissing]] = True
+        if in_use.all():  # nothing to drop, so no need to remap.
+            return output
 
-        output._levels = new_levels
+        keep = numpy.where(in_use)[0]
+        reindex = numpy.full(len(in_use), -1, dtype=self._codes.dtype)
+        reindex[keep] = numpy.arange(len(keep), dtype=self._codes.dtype)
+        output._codes = numpy.where(nonmissing, reindex[self._codes], -1)
+        output._levels = subset_sequence(self._levels, keep)
         return output
 
     def replace_levels(
@@ -663,11 +672,7 @@ class Factor:
             If ``in_place = True``, the levels are replaced in the current
             object, and a reference to the current object is returned.
         """
-        if in_place:
-            output = self
-        else:
-            output = copy(self)
-            output._codes = copy(self._codes)
+        output = self._define_output(in_place)
 
         lmapping = {}
         if isinstance(levels, str):
@@ -693,17 +698,16 @@ class Factor:
                     raise ValueError("all entries of 'levels' should be unique")
                 lmapping[x] = i
 
-        mapping = [-1] * len(self._levels)
-        for i, x in enumerate(self._levels):
-            if x in lmapping:
-                mapping[i] = lmapping[x]
+        if len(self._levels):
+            dtype = numpy.promote_types(
+                self._codes.dtype, numpy.min_scalar_type(-len(new_levels))
+            )
+            mapping = numpy.full(len(self._levels), -1, dtype=dtype)
+            for i, x in enumerate(self._levels):
+                if x in lmapping:
+                    mapping[i] = lmapping[x]
 
-        new_codes = output._codes
-        for i, x in enumerate(new_codes):
-            if x >= 0:
-                new_codes[i] = mapping[x]
-            else:
-                new_codes[i] = -1
+            output._codes = numpy.where(self._codes >= 0, mapping[self._codes], -1)
 
         output._levels = new_levels
         return output
@@ -750,8 +754,9 @@ class Factor:
         """
         from pandas import Categorical
 
-        return Categorical(
-            values=[self._levels[c] for c in self._codes],
+        return Categorical.from_codes(
+            codes=self._codes,
+            categories=self._levels.as_list(),
             ordered=self._ordered,
         )
 
@@ -841,14 +846,18 @@ def _combine_factors(*x: Factor):
                     new_levels.append(y)
                 mapping.append(all_levels_map[y])
 
-            curout = numpy.ndarray(
-                len(f), dtype=numpy.min_scalar_type(-len(new_levels))
-            )
-            for i, j in enumerate(f._codes):
-                if j < 0:
-                    curout[i] = j
-                else:
-                    curout[i] = mapping[j]
+            # Remapping the codes with a single vectorized gather, rather
+            # than one NumPy scalar store per element. A -1 code wraps
+            # around to the last mapping entry but is then masked out by
+            # the where().
+            target = numpy.min_scalar_type(-max(1, len(new_levels)))
+            if len(mapping):
+                mapping_arr = numpy.asarray(mapping, dtype=target)
+                curout = numpy.where(f._codes >= 0, mapping_arr[f._codes], -1).astype(
+                    target, copy=False
+                )
+            else:
+                curout = numpy.full(len(f), -1, dtype=target)
             new_codes.append(curout)
         new_ordered = False
 
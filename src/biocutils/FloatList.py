@@ -30,6 +30,10 @@ class FloatList(NamedList):
     :py:class:`~NamedList`), which provides some dictionary-like functionality.
     """
 
+    # No attributes beyond those of the parent; an empty __slots__ keeps
+    # instances free of a per-object __dict__.
+    __slots__ = ()
+
     def __init__(
         self,
         data: Optional[Iterable] = None,
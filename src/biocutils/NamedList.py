@@ -19,6 +19,8 @@ class NamedList:
     be indexed by position or slices (list) but also by name (dictionary).
     """
 
+    __slots__ = ("_data", "_names")
+
     def __init__(
         self,
         data: Optional[Iterable] = None,
@@ -73,11 +75,9 @@ class NamedList:
         Returns:
             Representation of the current list.
         """
-        message = type(self).__name__ + "(data=" + repr(self._data)
         if self._names is not None:
-            message += ", names=" + repr(self._names)
-        message += ")"
-        return message
+            return f"{type(self).__name__}(data={self._data!r}, names={self._names!r})"
+        return f"{type(self).__name__}(data={self._data!r})"
 
     def __str__(self) -> str:
         """
@@ -89,8 +89,7 @@ class NamedList:
             return (
                 "["
                 + ", ".join(
-                    repr(self._names[i]) + "=" + repr(x)
-                    for i, x in enumerate(self._data)
+                    f"{n!r}={x!r}" for n, x in zip(self._names, self._data)
                 )
                 + "]"
             )
@@ -108,6 +107,8 @@ class NamedList:
         """
         if not isinstance(other, NamedList):
             return False
+        if len(self._data) != len(other._data):
+            return False
         return self._data == other._data and self._names == other._names
 
     #################################
@@ -132,6 +133,12 @@ class NamedList:
     def _shallow_copy(self):
         return type(self)(self._data, self._names, _validate=False)
 
+    def _copy_for_mutation(self):
+        # For setters that only modify the data: constructs the output with a
+        # pre-copied data list (sharing the names), instead of taking a
+        # shallow copy and then cloning its data in a second step.
+        return type(self)(self._data.copy(), self._names, _validate=False)
+
     def set_names(self, names: Optional[Names], in_place: bool = False) -> "NamedList":
         """
         Args:
@@ -185,6 +192,17 @@ class NamedList:
         Returns:
             A ``NamedList`` is returned containing the specified subset.
         """
+        if type(index) is list and all(type(i) is int for i in index):
+            # Fast path for plain integer lists, skipping the subscript
+            # normalization and the subset_sequence dispatch.
+            data = self._data
+            outdata = [data[i] for i in index]
+            outnames = None
+            if self._names is not None:
+                nd = self._names.as_list()
+                outnames = Names([nd[i] for i in index], _validate=False)
+            return type(self)(outdata, outnames, _validate=False)
+
         index, scalar = normalize_subscript(index, len(self), self._names)
         outdata = subset_sequence(self._data, index)
         outnames = None
@@ -198,6 +216,14 @@ class NamedList:
 
         If ``index`` is a sequence, this is an alias for :py:meth:`~get_slice`.
         """
+        if isinstance(index, int) and not isinstance(index, bool):
+            # Fast path that avoids the subscript normalization overhead.
+            return self._data[index]
+        if isinstance(index, slice):
+            outnames = None
+            if self._names is not None:
+                outnames = self._names.get_slice(index)
+            return type(self)(self._data[index], outnames, _validate=False)
         index, scalar = normalize_subscript(index, len(self), self._names)
         if scalar:
             return self.get_value(index[0])
@@ -232,8 +258,7 @@ class NamedList:
         if in_place:
             output = self
         else:
-            output = self._shallow_copy()
-            output._data = output._data.copy()
+            output = self._copy_for_mutation()
 
         if isinstance(index, str):
             if self._names is not None:
@@ -245,7 +270,9 @@ class NamedList:
                 else:
                     output._data[i] = value
             else:
-                output._names = Names([""] * len(output._data))
+                # The filler names are already strings, so validation (which
+                # would re-coerce each element) can be skipped.
+                output._names = Names([""] * len(output._data), _validate=False)
                 output._names.append(index)
                 output._data.append(value)
         else:
@@ -284,17 +311,34 @@ class NamedList:
             ``index`` contains names that do not already exist in the object;
             a missing name error is raised instead.
         """
-        index, scalar = normalize_subscript(index, len(self), self._names)
         if in_place:
             output = self
         else:
-            output = self._shallow_copy()
-            output._data = output._data.copy()
+            output = self._copy_for_mutation()
+
+        if isinstance(index, slice) and isinstance(value, (list, tuple)):
+            # Bulk C-level assignment; only taken when the lengths line up
+            # exactly, as a length-changing slice assignment would
+            # desynchronize the data from the names.
+            if len(range(*index.indices(len(output._data)))) == len(value):
+                output._data[index] = value
+                return output
+
+        index, scalar = normalize_subscript(index, len(self), self._names)
         if scalar:
             output._data[index[0]] = value
         else:
-            for i, j in enumerate(index):
-                output._data[j] = value[i]
+            data = output._data
+            if getattr(value, "__len__", None) is not None and len(value) == len(index):
+                for j, v in zip(index, value):
+                    data[j] = v
+            else:
+                # Indexing into 'value' rather than zipping, so that a 'value'
+                # shorter than 'index' raises instead of silently truncating
+                # the assignment; this also covers lazy index-only wrappers
+                # without a __len__.
+                for i, j in enumerate(index):
+                    data[j] = value[i]
         return output
 
     def __setitem__(self, index: SubscriptTypes, value: Any):
@@ -307,6 +351,10 @@ class NamedList:
         """
         if isinstance(index, str):
             self.set_value(index, value, in_place=True)
+        elif isinstance(index, int) and not isinstance(index, bool):
+            # Fast path that avoids the subscript normalization overhead;
+            # still routed through set_value so that subclasses can coerce.
+            self.set_value(index, value, in_place=True)
         else:
             index, scalar = normalize_subscript(index, len(self), self._names)
             if scalar:
@@ -399,16 +447,35 @@ class NamedList:
             ``in_place = False``, this is a new object, otherwise a reference
             to the current object is returned.
         """
-        output = self._define_output(in_place)
-        previous_len = len(output)
-        output._data.extend(other)
+        # The identity check short-circuits the isinstance MRO walk for the
+        # common concrete-type case, and the result is reused for the name
+        # handling below instead of dispatching a second time.
+        other_is_named = type(other) is NamedList or isinstance(other, NamedList)
+        if other_is_named:
+            other_data = other._data
+        elif isinstance(other, list):
+            other_data = other
+        else:
+            other_data = list(other)
 
-        if isinstance(other, NamedList):
+        previous_len = len(self._data)
+        if in_place:
+            output = self
+            output._data.extend(other_data)
+        else:
+            newnames = self._names
+            if newnames is not None:
+                newnames = newnames.copy()
+            # Concatenating directly avoids copying the data and then
+            # re-growing the copy in a second pass.
+            output = type(self)(self._data + other_data, names=newnames, _validate=False)
+
+        if other_is_named and other._names is not None:
             if output._names is None:
-                output._names = Names([""] * previous_len)
+                output._names = Names([""] * previous_len, _validate=False)
             output._names.extend(other._names)
         elif output._names is not None:
-            output._names.extend([""] * len(other))
+            output._names.extend([""] * len(other_data))
 
         return output
 
@@ -438,9 +505,7 @@ class NamedList:
             in-place operations like :py:meth:`~append`, etc., on the new
             object will not change the original object.
         """
-        newnames = self._names
-        if newnames is not None:
-            newnames = newnames.copy()
+        newnames = self._names.copy() if self._names is not None else None
         return type(self)(self._data.copy(), names=newnames, _validate=False)
 
     def __copy__(self) -> "NamedList":
@@ -486,10 +551,17 @@ class NamedList:
 
             Values of the dictionary should be treated as read-only references.
         """
+        names = self._names.as_list()
+        output = dict(zip(names, self._data))
+        if len(output) == len(names):
+            # No duplicate names, so the C-level constructor's result is
+            # already correct.
+            return output
+
         output = {}
-        for i, n in enumerate(self._names):
+        for n, v in zip(names, self._data):
             if n not in output:
-                output[n] = self[i]
+                output[n] = v
         return output
 
     @staticmethod
@@ -513,7 +585,12 @@ class NamedList:
             A ``NamedList`` instance where the list elements are the values of
             ``x`` and the names are the stringified keys.
         """
-        return NamedList(list(x.values()), names=Names(str(y) for y in x.keys()))
+        keys = []
+        values = []
+        for k, v in x.items():
+            keys.append(k if type(k) is str else str(k))
+            values.append(v)
+        return NamedList(values, names=Names(keys, _validate=False))
 
 
 @subset_sequence.register
@@ -523,10 +600,33 @@ def _subset_sequence_NamedList(x: NamedList, indices: Sequence[int]) -> NamedLis
 
 @combine_sequences.register
 def _combine_sequences_NamedList(*x: NamedList) -> NamedList:
-    output = x[0].copy()
-    for i in range(1, len(x)):
-        output.extend(x[i])
-    return output
+    cls = type(x[0])
+    if any(type(y) is not cls for y in x):
+        # Mixed classes go through extend() so that subclasses like the typed
+        # lists can coerce the incoming elements.
+        output = x[0].copy()
+        for i in range(1, len(x)):
+            output.extend(x[i])
+        return output
+
+    new_data = []
+    has_names = False
+    for y in x:
+        new_data.extend(y._data)
+        if y._names is not None:
+            has_names = True
+
+    new_names = None
+    if has_names:
+        all_names = []
+        for y in x:
+            if y._names is None:
+                all_names.extend([""] * len(y._data))
+            else:
+                all_names.extend(y._names.as_list())
+        new_names = Names(all_names, _validate=False)
+
+    return cls(new_data, names=new_names, _validate=False)
 
 
 @assign_sequence.register
@@ -1,4 +1,5 @@
 from copy import deepcopy
+from sys import intern
 from typing import Any, Callable, Iterable, List, Optional, Sequence, Union
 
 from .assign_sequence import assign_sequence
@@ -16,6 +17,8 @@ class Names:
     such that callers can get or set elements by name instead of position.
     """
 
+    __slots__ = ("_names", "_reverse")
+
     def __init__(self, names: Optional[Iterable] = None, _validate: bool = True):
         """
         Args:
@@ -32,7 +35,9 @@ class Names:
             elif isinstance(names, Names):
                 names = names._names
             else:
-                names = list(str(y) for y in names)
+                # Interned names hash and compare by pointer, which speeds up
+                # the reverse-index lookups in map().
+                names = [intern(str(y)) for y in names]
         self._names = names
         self._reverse = None
 
@@ -90,6 +95,8 @@ class Names:
         Returns:
             Whether the current object is the same as ``other``.
         """
+        if other is self:
+            return True
         if not isinstance(other, Names):
             return False
         return self._names == other._names
@@ -114,10 +121,7 @@ class Names:
             or -1, if ``name`` is not present in this object.
         """
         self._populate_reverse_index()
-        if name in self._reverse:
-            return self._reverse[name]
-        else:
-            return -1
+        return self._reverse.get(name, -1)
 
     #################################
     #####>>>> Get/set items <<<<#####
@@ -177,7 +181,7 @@ class Names:
             output = self
         else:
             output = self.copy()
-        output._names[index] = str(value)
+        output._names[index] = intern(str(value))
         return output
 
     def set_slice(
@@ -207,7 +211,7 @@ class Names:
         index, scalar = normalize_subscript(index, len(self), None)
         output._wipe_reverse_index()
         for i, j in enumerate(index):
-            output._names[j] = str(value[i])
+            output._names[j] = intern(str(value[i]))
         return output
 
     def __setitem__(self, index: SubscriptTypes, value: Any):
@@ -246,7 +250,7 @@ class Names:
             new object or a reference to the current object.
         """
         output = self._define_output(in_place)
-        name = str(value)
+        name = intern(str(value))
         if output._reverse is not None and name not in output._reverse:
             output._reverse[name] = len(output)
         output._names.append(name)
@@ -270,8 +274,24 @@ class Names:
             a new object or a reference to the current object.
         """
         output = self._define_output(in_place)
-        output._wipe_reverse_index()
-        output._names.insert(index, str(value))
+        value = intern(str(value))
+        if output._reverse is not None:
+            # Shift affected positions instead of wiping the whole index,
+            # which would force a full O(n) rebuild on the next map().
+            pos = index
+            n = len(output._names)
+            if pos < 0:
+                pos = max(0, pos + n)
+            elif pos > n:
+                pos = n
+            rev = output._reverse
+            for k, v in rev.items():
+                if v >= pos:
+                    rev[k] = v + 1
+            prev = rev.get(value, -1)
+            if prev < 0 or prev > pos:
+                rev[value] = pos
+        output._names.insert(index, value)
         return output
 
     def insert(self, index: int, value: str):
@@ -290,16 +310,19 @@ class Names:
             new object or a reference to the current object.
         """
         output = self._define_output(in_place)
-        if output._reverse is not None:
-            for i, n in enumerate(value):
-                n = str(n)
-                if n not in output._reverse:
-                    output._reverse[n] = len(output._names)
-                output._names.append(n)
-        elif isinstance(value, Names):
-            output._names.extend(value._names)
+        if isinstance(value, Names):
+            coerced = value._names
         else:
-            output._names.extend(str(y) for y in value)
+            coerced = [intern(str(y)) for y in value]
+
+        if output._reverse is not None:
+            rev = output._reverse
+            base = len(output._names)
+            for i, n in enumerate(coerced):
+                if n not in rev:
+                    rev[n] = base + i
+
+        output._names.extend(coerced)
         return output
 
     def extend(self, value: Sequence[str]):
@@ -357,7 +380,10 @@ class Names:
         Returns:
             A deep copy of this ``Names`` object with the same contents.
         """
-        return type(self)(deepcopy(self._names, memo, _nil), _validate=False)
+        # Names only ever contains immutable strings, so a C-level shallow
+        # copy of the list is equivalent to (and much faster than) running
+        # each element through the generic deepcopy machinery.
+        return type(self)(self._names.copy(), _validate=False)
 
 
 @subset_sequence.register
@@ -6,6 +6,10 @@ from .normalize_subscript import SubscriptTypes
 
 
 def _coerce_to_str(x: Any):
+    # Exact-type check first; already-str values are the common case and can
+    # skip both the None test and the str() dispatch.
+    if type(x) is str:
+        return x
     return None if x is None else str(x)
 
 
@@ -25,6 +29,10 @@ class StringList(NamedList):
     :py:class:`~NamedList`), which provides some dictionary-like functionality.
     """
 
+    # No attributes beyond those of the parent; an empty __slots__ keeps
+    # instances free of a per-object __dict__.
+    __slots__ = ()
+
     def __init__(
         self,
         data: Optional[Iterable] = None,
@@ -53,7 +61,13 @@ class StringList(NamedList):
                     if isinstance(data, NamedList):
                         data = data._data
                     original = data
-                    data = list(_coerce_to_str(item) for item in original)
+                    # Most inputs are already strings, so dodging the str()
+                    # call (and the _coerce_to_str frame) for those values
+                    # makes construction mostly a C-level list build.
+                    data = [
+                        item if type(item) is str or item is None else str(item)
+                        for item in original
+                    ]
         super().__init__(data, names, _validate=_validate)
 
     def set_value(
@@ -66,6 +80,16 @@ class StringList(NamedList):
         self, index: SubscriptTypes, value: Sequence, in_place: bool = False
     ) -> "StringList":
         """Calls :py:meth:`~biocutils.NamedList.NamedList.set_slice` after coercing ``value`` to strings."""
+        if isinstance(value, StringList):
+            # Already guaranteed to hold strings (or None), so there's no
+            # point re-coercing every element.
+            return super().set_slice(index, value, in_place=in_place)
+        if isinstance(value, (list, tuple)):
+            # Coercing eagerly in one pass is cheaper than the lazy
+            # _SubscriptCoercer, which pays a __getitem__ call per accessed
+            # element; it also makes the parent's bulk assignment applicable.
+            value = [_coerce_to_str(v) for v in value]
+            return super().set_slice(index, value, in_place=in_place)
         return super().set_slice(index, _SubscriptCoercer(value), in_place=in_place)
 
     def safe_insert(
@@ -80,6 +104,14 @@ class StringList(NamedList):
 
     def safe_extend(self, other: Iterable, in_place: bool = True) -> "StringList":
         """Calls :py:meth:`~biocutils.NamedList.NamedList.safe_extend` after coercing elements of ``other`` to strings."""
+        if isinstance(other, StringList):
+            # Already guaranteed to hold strings (or None), so the coercion
+            # pass can be skipped; deliberately passed as a plain list so
+            # that the names of 'other' are dropped, just like any other
+            # coerced input.
+            return super().safe_extend(other._data, in_place=in_place)
+        # A materialized list lets the parent extend in one C-level call,
+        # rather than pulling elements through a generator one at a time.
         return super().safe_extend(
-            (_coerce_to_str(y) for y in other), in_place=in_place
+            [_coerce_to_str(y) for y in other], in_place=in_place
         )
@@ -26,11 +26,13 @@ def combine(*x: Any):
             has_nd = True
         else:
             has_1d = True
+        if has_nd and has_1d:
+            # No point probing the remaining objects once we know the mix
+            # is invalid.
+            raise ValueError(
+                "cannot mix 1-dimensional and higher-dimensional objects in `combine`"
+            )
 
-    if has_nd and has_1d:
-        raise ValueError(
-            "cannot mix 1-dimensional and higher-dimensional objects in `combine`"
-        )
     if has_nd:
         return combine_rows(*x)
     else:
@@ -45,16 +45,22 @@ def factorize(
         that will instead be represented by -1 in the second array.
     """
     if levels is None:
-        present = set()
+        mapping = {}
         levels = []
 
         for val in x:
-            if not is_missing_scalar(val) and val not in present:
+            if not is_missing_scalar(val) and val not in mapping:
+                mapping[val] = len(levels)
                 levels.append(val)
-                present.add(val)
 
         if sort_levels:
             levels.sort()
+            mapping = {val: i for i, val in enumerate(levels)}
+
+        # Reusing the discovery dictionary so that match() doesn't have to
+        # rebuild an index over the levels in a second pass.
+        codes = match(x, mapping, dtype=dtype, fail_missing=fail_missing)
+    else:
+        codes = match(x, levels, dtype=dtype, fail_missing=fail_missing)
 
-    codes = match(x, levels, dtype=dtype, fail_missing=fail_missing)
     return levels, codes
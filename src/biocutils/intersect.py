@@ -27,60 +27,51 @@ def intersect(*x: Sequence, duplicate_method: DUPLICATE_METHOD = "first") -> lis
         return []
 
     first = x[0]
-    if nargs == 1:
-        # Special handling of n == 1, for efficiency.
-        present = set()
-        output = []
-
-        def handler(f):
-            if not is_missing_scalar(f) and f not in present:
-                output.append(f)
-                present.add(f)
+    if iter(first) is first:
+        # One-shot iterators (e.g., generators) would be exhausted by the
+        # first pass and cannot be reversed, so materialize them up front.
+        # Re-iterable sequences are left as-is to avoid a copy.
+        first = list(first)
 
+    if nargs == 1:
+        # Special handling of n == 1, for efficiency. dict.fromkeys
+        # deduplicates while preserving insertion order in a single C-level
+        # pass, replacing the separate 'seen' set and output list.
         if duplicate_method == "first":
-            for f in first:
-                handler(f)
+            return list(
+                dict.fromkeys(f for f in first if not is_missing_scalar(f))
+            )
         else:
-            for f in reversed(first):
-                handler(f)
+            output = list(
+                dict.fromkeys(f for f in reversed(first) if not is_missing_scalar(f))
+            )
             output.reverse()
+            return output
 
-        return output
-
-    # The 'occurrences' dict contains the count and the index of the last
-    # sequence that incremented the count. The intersection consists of all
-    # values where the count == number of sequences. We need to store the index
-    # of the last sequence so as to avoid adding a duplicate value twice from a
-    # single sequence.
-    occurrences = {}
-    for f in first:
-        if not is_missing_scalar(f) and f not in occurrences:
-            occurrences[f] = [1, 0]
-
+    # Intersecting the remaining sequences with C-level set operations.
+    # Missing values must be filtered out before they are hashed, as the
+    # NumPy masked constant is unhashable. Duplicates within a sequence are
+    # handled for free by the set semantics.
+    common = {f for f in first if not is_missing_scalar(f)}
     for i in range(1, nargs):
-        for f in x[i]:
-            if not is_missing_scalar(f) and f in occurrences:
-                state = occurrences[f]
-                if state[1] < i:
-                    state[0] += 1
-                    state[1] = i
+        if not common:
+            return []
+        common.intersection_update(f for f in x[i] if not is_missing_scalar(f))
 
-    # Going through the first vector again to preserve order.
+    # Going through the first vector again to preserve order, removing each
+    # reported value from 'common' so that duplicates are only emitted once.
     output = []
 
-    def handler(f):
-        if not is_missing_scalar(f) and f in occurrences:
-            state = occurrences[f]
-            if state[0] == nargs and state[1] >= 0:
-                output.append(f)
-                state[1] = -1  # avoid duplicates
-
     if duplicate_method == "first":
         for f in first:
-            handler(f)
+            if not is_missing_scalar(f) and f in common:
+                output.append(f)
+                common.remove(f)
     else:
         for f in reversed(first):
-            handler(f)
+            if not is_missing_scalar(f) and f in common:
+                output.append(f)
+                common.remove(f)
         output.reverse()
 
     return output
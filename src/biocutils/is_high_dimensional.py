@@ -14,4 +14,7 @@ def is_high_dimensional(x):
     Returns:
         Whether ``x`` is high-dimensional.
     """
-    return hasattr(x, "shape") and len(x.shape) > 1
+    # Single attribute probe; hasattr() followed by an attribute access
+    # would look up 'shape' twice.
+    shape = getattr(x, "shape", None)
+    return shape is not None and len(shape) > 1
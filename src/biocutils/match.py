@@ -46,19 +46,20 @@ def match(
 
     if dtype is None:
         dtype = numpy.min_scalar_type(-len(targets)) # get a signed type
-    indices = numpy.zeros(len(x), dtype=dtype)
 
     if fail_missing is None:
         fail_missing = numpy.issubdtype(dtype, numpy.unsignedinteger)
 
-    # Separate loops to reduce branching in the tight inner loop.
+    # Separate paths to reduce branching in the tight inner loop.
     if not fail_missing:
-        for i, y in enumerate(x):
-            if y in targets:
-                indices[i] = targets[y]
-            else:
-                indices[i] = -1
+        # dict.get with a default collapses the membership test and the
+        # subsequent lookup into a single hash probe, and fromiter() writes
+        # each result straight into the output array without a per-element
+        # NumPy scalar assignment.
+        get = targets.get
+        indices = numpy.fromiter((get(y, -1) for y in x), dtype=dtype, count=len(x))
     else:
+        indices = numpy.zeros(len(x), dtype=dtype)
         for i, y in enumerate(x):
             if not y in targets:
                 raise ValueError("cannot find '" + str(y) + "' in 'targets'")
@@ -6,11 +6,7 @@ from .subset_sequence import subset_sequence
 
 
 def _get_max_width(col: List[str]):
-    width = 0
-    for y in col:
-        if len(y) > width:
-            width = len(y)
-    return width
+    return max(map(len, col), default=0)
 
 
 def print_wrapped_table(
@@ -69,7 +65,7 @@ def print_wrapped_table(
             new_floating_names.append(y.rjust(floatwidth))
         floating_names = new_floating_names
 
-    output = ""
+    lines = []
 
     def reinitialize():
         if floating_names is None:
@@ -85,21 +81,22 @@ def print_wrapped_table(
         width = _get_max_width(col)
 
         if not init and used + width + len(sep) > window:
-            for line in contents:
-                output += line + "\n"
+            lines.extend(contents)
             contents = reinitialize()
             init = True
             used = floatwidth
 
-        for i, y in enumerate(col):
-            if used > 0:
-                contents[i] += sep
-            contents[i] += y.rjust(width)
+        if used > 0:
+            for i, y in enumerate(col):
+                contents[i] += sep + y.rjust(width)
+        else:
+            for i, y in enumerate(col):
+                contents[i] += y.rjust(width)
         used += width + len(sep)
         init = False
 
-    output += "\n".join(contents)
-    return output
+    lines.extend(contents)
+    return "\n".join(lines)
 
 
 def create_floating_names(
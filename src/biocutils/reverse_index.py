@@ -12,9 +12,8 @@ def build_reverse_index(obj: Sequence[str]):
     Returns:
         A map of keys and their index positions.
     """
-    revmap = {}
-    for i, n in enumerate(obj):
-        if n not in revmap:
-            revmap[n] = i
-
-    return revmap
+    # Feeding the pairs from the end means that the last write for each key
+    # is its first occurrence, so the C-level dict constructor preserves the
+    # first-occurrence semantics without a per-element membership check.
+    n = len(obj)
+    return dict(zip(reversed(obj), range(n - 1, -1, -1)))
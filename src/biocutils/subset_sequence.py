@@ -1,6 +1,8 @@
 from functools import singledispatch
 from typing import Any, Sequence, Union
 
+import numpy
+
 
 @singledispatch
 def subset_sequence(x: Any, indices: Sequence[int]) -> Any:
@@ -28,6 +30,15 @@ def _subset_sequence_list(x: list, indices: Sequence) -> list:
     return type(x)(x[i] for i in indices)
 
 
+@subset_sequence.register
+def _subset_sequence_ndarray(x: numpy.ndarray, indices: Sequence) -> numpy.ndarray:
+    if not isinstance(indices, numpy.ndarray):
+        # Converting up-front avoids NumPy's per-element inspection of a
+        # Python list inside the fancy-indexing machinery.
+        indices = numpy.asarray(indices, dtype=numpy.intp)
+    return x[indices]
+
+
 @subset_sequence.register
 def _subset_sequence_range(x: range, indices: Sequence) -> Union[list, range]:
     if isinstance(indices, range):
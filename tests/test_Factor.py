@@ -168,6 +168,12 @@ def test_Factor_set_slice():
     assert y.get_levels() == f.get_levels()
     assert y.get_names() == f.get_names()
 
+    # Mismatched replacement lengths should fail instead of broadcasting.
+    with pytest.raises(IndexError, match="length of 'value'"):
+        f.set_slice([0, 1, 2], Factor([2], levels=["A", "B", "C", "D", "E"]))
+    with pytest.raises(IndexError, match="length of 'value'"):
+        f.set_slice([0, 1], Factor([0, 1, 2], levels=["x", "y", "z"]))
+
 
 def test_Factor_setitem():
     f = Factor([0, 1, 2, 0, 2, 4], levels=["A", "B", "C", "D", "E"])
@@ -330,8 +336,16 @@ def test_Factor_pandas():
     pcat = f2.to_pandas()
     assert pcat is not None
     assert len(pcat) == len(f2)
+
     assert pcat.ordered == f2.get_ordered()
 
+    # Missing codes should translate to missing categorical entries.
+    f3 = Factor([0, -1, 1], levels=["A", "B"])
+    pcat = f3.to_pandas()
+    assert pcat[0] == "A"
+    assert pd.isna(pcat[1])
+    assert pcat[2] == "B"
+
 
 def test_Factor_init_from_list():
     f1 = Factor.from_sequence(["A", "B", "A", "B", "E"])
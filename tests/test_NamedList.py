@@ -182,6 +182,15 @@ def test_NamedList_extend():
     assert x.as_list() == [ 1, 2, 3, 4, None, 1, True, False, 2, None ]
     assert x.get_names().as_list() == [ "A", "B", "C", "D", "", "", "", "E", "F", "G" ]
 
+    # Extending by a NamedList without names works on both sides.
+    y = NamedList([1,2]).safe_extend(NamedList([3]))
+    assert y.as_list() == [ 1, 2, 3 ]
+    assert y.get_names() is None
+
+    y = NamedList([1,2], names=["A", "B"]).safe_extend(NamedList([3]))
+    assert y.as_list() == [ 1, 2, 3 ]
+    assert y.get_names().as_list() == [ "A", "B", "" ]
+
 
 def test_NamedList_append():
     x = NamedList([1,2,3,4])
@@ -196,3 +196,11 @@ def test_Names_generics():
     assert isinstance(ass, Names)
     assert ass.as_list() == ["1", "b", "c", "4"]
 
+
+
+def test_Names_map_duplicates():
+    x = Names(["a", "b", "a", "c", "b"])
+    assert x.map("a") == 0
+    assert x.map("b") == 1
+    assert x.map("c") == 3
+    assert x.map("d") == -1
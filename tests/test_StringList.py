@@ -77,6 +77,11 @@ def test_StringList_mutations():
     x.extend(alt)
     assert x.as_list() == [ "1", "FOO", "2", None, "3", "4", None, "1", "True", "YAY", "BAR", "WHEE" ]
 
+    # Extending from another StringList drops its names, like any other input:
+    y = StringList(["x", "y"]).safe_extend(StringList(["z"], names=["N"]), in_place=False)
+    assert y.as_list() == [ "x", "y", "z" ]
+    assert y.get_names() is None
+
     # Appending:
     x.append(1)
     assert x[-1] == "1"